@@ -1,8 +1,32 @@
+import contextlib
 import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from git.exc import GitCommandError
+# Importing GitPython is expensive (it transitively loads gitdb/smmap and probes $PATH for the
+# git binary): do it once at module load and reuse the symbols instead of re-importing per call.
+# _GIT_MODULE_MISSING distinguishes a missing python module from a missing git binary.
+try:
+    from git import Repo, Remote, Submodule, InvalidGitRepositoryError, FetchInfo
+    from git.exc import GitCommandError, RepositoryDirtyError
+    _GIT_OK = True
+    _GIT_MODULE_MISSING = False
+except ModuleNotFoundError:
+    _GIT_OK = False
+    _GIT_MODULE_MISSING = True
+except ImportError:
+    _GIT_OK = False
+    _GIT_MODULE_MISSING = False
+
+# Optional libgit2 bindings: when available, read-heavy operations run in-process
+# instead of forking a git subprocess per call through GitPython
+try:
+    import pygit2  # type: ignore
+except ImportError:
+    pygit2 = None  # type: ignore
 
 from exegol.console.cli.ParametersManager import ParametersManager
 from exegol.utils.ConstantConfig import ConstantConfig
@@ -12,9 +36,29 @@ from exegol.utils.ExeLog import logger, console
 
 # SDK Documentation : https://gitpython.readthedocs.io/en/stable/index.html
 
+class _NullStatus:
+    """No-op stand-in for a rich Status object on headless runs."""
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+
+def _maybeStatus(message: str):
+    """Wrap a long operation in a console status spinner, but only when attached to a terminal.
+    On non-TTY runs (CI, scripts) the rich renderer thread is pure overhead."""
+    if console.is_terminal:
+        return console.status(message, spinner_style="blue")
+    return contextlib.nullcontext(_NullStatus())
+
+
 class GitUtils:
     """Utility class between exegol and the Git SDK"""
 
+    # Clone depth applied to submodule source updates, which track the remote tip: a single commit
+    # of history is enough. Initial submodule init cannot be shallow because the parent repository
+    # can pin a commit that is not the remote tip. Can be raised for dev builds.
+    SUBMODULE_CLONE_DEPTH: int = 1
+
     def __init__(self,
                  path: Optional[Path] = None,
                  name: str = "wrapper",
@@ -29,6 +73,7 @@ class GitUtils:
         self.__repo_path = path
         self.__git_name: str = name
         self.__git_subject: str = subject
+        self.__catfile_process: Optional[subprocess.Popen] = None
         abort_loading = False
         # Check if .git directory exist
         try:
@@ -52,20 +97,19 @@ class GitUtils:
             logger.error("The current user does not have the necessary rights to perform the self-update operations.")
             logger.error("Please reinstall exegol (with git clone) without sudo.")
             abort_loading = True
-        # locally import git in case git is not installed of the system
-        try:
-            from git import Repo, Remote, InvalidGitRepositoryError, FetchInfo
-        except ModuleNotFoundError:
+        # git module is imported once at module load, in case git is not installed on the system
+        if not _GIT_OK:
             self.__git_disable = True
-            logger.warning("Git module is not installed. Python module 'GitPython' is missing, please install it with pip.")
-            return
-        except ImportError:
-            self.__git_disable = True
-            logger.error("Unable to find git tool locally. Skipping git operations.")
+            if _GIT_MODULE_MISSING:
+                logger.warning("Git module is not installed. Python module 'GitPython' is missing, please install it with pip.")
+            else:
+                logger.error("Unable to find git tool locally. Skipping git operations.")
             return
         self.__gitRepo: Optional[Repo] = None
         self.__gitRemote: Optional[Remote] = None
         self.__fetchBranchInfo: Optional[FetchInfo] = None
+        self.__fetch_cache: Optional[Tuple[float, List[FetchInfo]]] = None
+        self.__pgrepo: Optional["pygit2.Repository"] = None
 
         if abort_loading:
             return
@@ -87,34 +131,51 @@ class GitUtils:
         else:
             logger.warning("No remote git origin found on repository")
             logger.debug(self.__gitRepo.remotes)
+        if pygit2 is not None:
+            try:
+                self.__pgrepo = pygit2.Repository(str(self.__repo_path))
+            except pygit2.GitError as e:
+                logger.debug(f"Unable to load the repository with pygit2, falling back to GitPython: {e}")
         if not skip_submodule_update:
             self.__initSubmodules()
 
     def clone(self, repo_url: str, optimize_disk_space: bool = True) -> bool:
+        """Clone the 'repo_url' git repository to the local path.
+        With optimize_disk_space, a shallow and blob-less clone is created: only the current tip is fetched,
+        which reduces transfer size and disk usage but prevents any offline history inspection."""
         if ParametersManager().offline_mode:
             logger.error("It's not possible to clone a repository in offline mode ...")
             return False
         if self.isAvailable:
             logger.warning(f"The {self.getName()} repo is already cloned.")
             return False
-        # locally import git in case git is not installed of the system
-        try:
-            from git import Repo, Remote, InvalidGitRepositoryError, FetchInfo
-        except ModuleNotFoundError:
-            logger.debug("Git module is not installed.")
-            return False
-        except ImportError:
-            logger.error(f"Unable to find git on your machine. The {self.getName()} repository cannot be cloned.")
-            logger.warning("Please install git to support this feature.")
+        # git module is imported once at module load, in case git is not installed on the system
+        if not _GIT_OK:
+            if _GIT_MODULE_MISSING:
+                logger.debug("Git module is not installed.")
+            else:
+                logger.error(f"Unable to find git on your machine. The {self.getName()} repository cannot be cloned.")
+                logger.warning("Please install git to support this feature.")
             return False
         custom_options = []
         if optimize_disk_space:
-            custom_options.append('--depth=1')
+            # Exegol only needs the current tip: fetch a single shallow commit without blobs from past revisions
+            custom_options.extend(['--depth=1', '--single-branch', '--filter=blob:none', '--no-tags'])
         # TODO add progress bar via TUI
-        from git import GitCommandError
         try:
             with console.status(f"Downloading {self.getName()} git repository", spinner_style="blue"):
-                self.__gitRepo = Repo.clone_from(repo_url, str(self.__repo_path), multi_options=custom_options)
+                try:
+                    self.__gitRepo = Repo.clone_from(repo_url, str(self.__repo_path), multi_options=custom_options)
+                except GitCommandError as e:
+                    stderr = str(e.stderr).lower()
+                    # Only retry when the failure actually comes from the partial clone filter:
+                    # other errors (network, auth, destination dir, ...) must surface as-is
+                    if '--filter=blob:none' not in custom_options or \
+                            ('filter' not in stderr and 'server does not support' not in stderr):
+                        raise
+                    # Older git servers don't support partial clone filters, fallback to a plain shallow clone
+                    logger.debug(f"Partial clone unsupported by the remote server, falling back to shallow clone: {e}")
+                    self.__gitRepo = Repo.clone_from(repo_url, str(self.__repo_path), multi_options=['--depth=1'])
         except GitCommandError as e:
             # GitPython user \n only
             error = GitUtils.formatStderr(e.stderr)
@@ -123,10 +184,32 @@ class GitUtils:
         self.__init_repo()
         return True
 
+    def __fetch(self, force: bool = False) -> "List[FetchInfo]":
+        """Fetch the remote branch refs, reusing the previous result for a short time.
+        Successive checks in the same interactive session (e.g. listing branches then checking
+        the up-to-date status) would otherwise each run a full remote negotiation."""
+        assert self.__gitRemote is not None
+        # 30 seconds is enough to cover a whole wrapper invocation without serving stale refs
+        if not force and self.__fetch_cache is not None and time.monotonic() - self.__fetch_cache[0] < 30:
+            return self.__fetch_cache[1]
+        # Restrict the fetch to branch heads: tags and other refs are not needed by the wrapper
+        fetch_result = self.__gitRemote.fetch(refspec=['+refs/heads/*:refs/remotes/origin/*'], no_tags=True)
+        self.__fetch_cache = (time.monotonic(), fetch_result)
+        return fetch_result
+
     def getCurrentBranch(self) -> Optional[str]:
         """Get current git branch name"""
         if not self.isAvailable:
             return None
+        if self.__pgrepo is not None:
+            try:
+                if self.__pgrepo.head_is_detached:
+                    logger.debug("Git HEAD is detached, cant find the current branch.")
+                    return None
+                return self.__pgrepo.head.shorthand
+            except pygit2.GitError:
+                logger.error(f"Unable to find current git branch in the {self.__git_name} repository. Check the path in the .git file from {self.__repo_path / '.git'}")
+                return None
         assert self.__gitRepo is not None
         try:
             return str(self.__gitRepo.active_branch)
@@ -144,13 +227,16 @@ class GitUtils:
         result: List[str] = []
         if self.__gitRemote is None:
             return result
-        for branch in self.__gitRemote.fetch():
-            branch_parts = branch.name.split('/')
-            if len(branch_parts) < 2:
-                logger.warning(f"Branch name is not correct: {branch.name}")
-                result.append(branch.name)
+        assert self.__gitRepo is not None
+        # The refs advertisement alone lists the remote branches, no pack transfer is needed
+        raw = self.__gitRepo.git.ls_remote('--heads', 'origin')
+        for line in raw.splitlines():
+            ref_path = line.split('\t')[-1]
+            if not ref_path.startswith('refs/heads/'):
+                logger.warning(f"Branch name is not correct: {ref_path}")
+                result.append(ref_path)
             else:
-                result.append(branch_parts[1])
+                result.append(ref_path[len('refs/heads/'):])
         return result
 
     def safeCheck(self) -> bool:
@@ -160,11 +246,67 @@ class GitUtils:
         if self.__gitRepo is None or self.__gitRemote is None:
             return False
         # Submodule changes must be ignored to update the submodules sources independently of the wrapper
-        is_dirty = self.__gitRepo.is_dirty(submodules=False)
+        if self.__pgrepo is not None:
+            submodule_paths = set(self.__pgrepo.listall_submodules())
+            is_dirty = False
+            # Untracked and ignored files don't prevent an update (same semantic as is_dirty):
+            # exclude them from the status walk instead of discarding them afterwards
+            for file_path in self.__pgrepo.status(untracked_files="no", ignored=False):
+                if file_path not in submodule_paths:
+                    is_dirty = True
+                    break
+        else:
+            # A single porcelain status call replaces the multiple diff-index subprocesses run by is_dirty
+            out = self.__gitRepo.git.status('--porcelain=v2', '--ignore-submodules=all')
+            # Changed ('1'), renamed/copied ('2') and unmerged ('u') entries make the repo dirty,
+            # untracked ('?') and ignored ('!') files don't prevent an update (same semantic as is_dirty)
+            is_dirty = any(line and line[0] in ('1', '2', 'u') for line in out.splitlines())
         if is_dirty:
             logger.warning("Local git have unsaved change. Skipping source update.")
         return not is_dirty
 
+    def __catfile(self) -> subprocess.Popen:
+        """Lazily spawn a single long-lived 'git cat-file --batch-check' process.
+        Streaming object queries to it amortizes the fork/exec cost over the whole session."""
+        if self.__catfile_process is None or self.__catfile_process.poll() is not None:
+            self.__catfile_process = subprocess.Popen(
+                ['git', '-C', str(self.__repo_path), 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
+        return self.__catfile_process
+
+    def __resolve(self, ref: str) -> Optional[str]:
+        """Resolve any local git reference to its commit SHA through the persistent cat-file process."""
+        process = self.__catfile()
+        assert process.stdin is not None and process.stdout is not None
+        try:
+            process.stdin.write(f"{ref}\n".encode())
+            answer = process.stdout.readline().decode().strip().split(' ')
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unable to resolve git reference '{ref}': {e}")
+            return None
+        if len(answer) != 2 or answer[1] == "missing":
+            logger.debug(f"Git reference '{ref}' not found in the {self.__git_name} repository.")
+            return None
+        return answer[0]
+
+    def __is_ancestor(self, ancestor: str, commit: str) -> bool:
+        """Check if 'ancestor' is an ancestor of 'commit' (a commit is considered its own ancestor)."""
+        return subprocess.run(['git', '-C', str(self.__repo_path), 'merge-base', '--is-ancestor', ancestor, commit],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+    def __remoteTipSha(self, branch: str) -> Optional[str]:
+        """Ask the remote for the tip SHA of 'branch' through ls-remote.
+        Only the refs advertisement crosses the wire, no pack data is transferred."""
+        assert self.__gitRepo is not None
+        try:
+            raw = self.__gitRepo.git.ls_remote('origin', f'refs/heads/{branch}')
+        except GitCommandError as e:
+            logger.debug(f"Unable to ls-remote the branch '{branch}': {e}")
+            return None
+        if not raw.strip():
+            return None
+        return raw.split()[0]
+
     def isUpToDate(self, branch: Optional[str] = None) -> bool:
         """Check if the local git repository is up-to-date.
         This method compare the last commit local and the ancestor."""
@@ -178,10 +320,36 @@ class GitUtils:
         assert self.__gitRepo is not None
         assert self.__gitRemote is not None
         # Get last local commit
-        current_commit = self.__gitRepo.heads[branch].commit
-        # Get last remote commit
+        current_commit = self.__resolve(f"refs/heads/{branch}")
+        if current_commit is None:
+            current_commit = self.__gitRepo.heads[branch].commit.hexsha
+        # When the remote tip matches the local commit (the common case), no fetch is needed at all
+        remote_tip = self.__remoteTipSha(branch)
+        if remote_tip is not None and remote_tip == current_commit:
+            return True
+        if self.__pgrepo is not None:
+            pg_result = self.__isUpToDateLibgit2(branch)
+            if pg_result is not None:
+                return pg_result
+            # pygit2 could not fetch (e.g. credentials needed): fall through to the system-git path
+        # Narrow the fetch to the target branch only. No blob filter here: a filtered fetch would
+        # permanently convert the user's checkout into a partial clone, and update() needs the
+        # blobs right away for its fast-forward merge anyway
+        try:
+            self.__gitRepo.git.fetch('--no-tags', '--negotiation-tip', branch, 'origin', branch)
+        except GitCommandError as e:
+            logger.debug(f"Narrow fetch of branch '{branch}' failed, falling back to a full fetch: {e}")
+        else:
+            try:
+                remote_commit = self.__gitRepo.refs[f'origin/{branch}'].commit.hexsha
+            except IndexError:
+                logger.warning("The selected branch is local and cannot be updated.")
+                return True
+            # Check if remote_commit is an ancestor of the last local commit (check if there is local commit ahead)
+            return self.__is_ancestor(remote_commit, current_commit)
+        # Fallback full fetch (also used on the first fetch after a clone), keeping the FetchInfo flag logging
         try:
-            fetch_result = self.__gitRemote.fetch()
+            fetch_result = self.__fetch()
         except GitCommandError:
             logger.warning("Unable to fetch information from remote git repository, do you have internet ?")
             return True
@@ -195,7 +363,6 @@ class GitUtils:
         logger.debug(f"Fetch note : {self.__fetchBranchInfo.note}")
         logger.debug(f"Fetch old commit : {self.__fetchBranchInfo.old_commit}")
         logger.debug(f"Fetch remote path : {self.__fetchBranchInfo.remote_ref_path}")
-        from git import FetchInfo
         # Bit check to detect flags info
         if self.__fetchBranchInfo.flags & FetchInfo.HEAD_UPTODATE != 0:
             logger.debug("HEAD UP TO DATE flag detected")
@@ -210,26 +377,60 @@ class GitUtils:
         if self.__fetchBranchInfo.flags & FetchInfo.NEW_TAG != 0:
             logger.debug("NEW TAG flag detected")
 
-        remote_commit = self.__fetchBranchInfo.commit
+        remote_commit = self.__fetchBranchInfo.commit.hexsha
         # Check if remote_commit is an ancestor of the last local commit (check if there is local commit ahead)
-        return self.__gitRepo.is_ancestor(remote_commit, current_commit)
+        return self.__is_ancestor(remote_commit, current_commit)
+
+    def __isUpToDateLibgit2(self, branch: str) -> Optional[bool]:
+        """isUpToDate implementation backed by pygit2: fetch and ancestor check run in-process through libgit2.
+        Return None when the fetch cannot be performed (e.g. the remote requires credential callbacks),
+        to let the caller fall back to the system-git fetch path."""
+        assert self.__pgrepo is not None
+        try:
+            local_oid = self.__pgrepo.lookup_reference(f"refs/heads/{branch}").target
+        except KeyError:
+            logger.warning("The selected branch is local and cannot be updated.")
+            return True
+        try:
+            self.__pgrepo.remotes['origin'].fetch()
+        except pygit2.GitError as e:
+            logger.debug(f"Unable to fetch the remote repository with pygit2, falling back to GitPython: {e}")
+            return None
+        try:
+            remote_oid = self.__pgrepo.lookup_reference(f"refs/remotes/origin/{branch}").target
+        except KeyError:
+            logger.warning("The selected branch is local and cannot be updated.")
+            return True
+        # Check if the remote commit is an ancestor of the last local commit (check if there is local commit ahead)
+        return local_oid == remote_oid or self.__pgrepo.descendant_of(local_oid, remote_oid)
 
     def update(self) -> bool:
         """Update local git repository within current branch"""
         assert self.isAvailable
         assert not ParametersManager().offline_mode
+        # The update must rely on fresh remote refs, not a cached fetch
+        self.__fetch_cache = None
         if not self.safeCheck():
             return False
+        # Resolve the branch once for the whole update (each call costs a subprocess)
+        branch = self.getCurrentBranch()
         # Check if the git branch status is not detached
-        if self.getCurrentBranch() is None:
+        if branch is None:
             return False
-        if self.isUpToDate():
-            logger.info(f"Git branch [green]{self.getCurrentBranch()}[/green] is already up-to-date.")
+        if self.isUpToDate(branch):
+            logger.info(f"Git branch [green]{branch}[/green] is already up-to-date.")
             return False
         if self.__gitRemote is not None:
-            logger.info(f"Using branch [green]{self.getCurrentBranch()}[/green] on {self.getName()} repository")
+            assert self.__gitRepo is not None
+            logger.info(f"Using branch [green]{branch}[/green] on {self.getName()} repository")
             with console.status(f"Updating git [green]{self.getName()}[/green]", spinner_style="blue"):
-                self.__gitRemote.pull(refspec=self.getCurrentBranch())
+                # isUpToDate() has already fetched origin/<branch>: fast-forward onto the fetched
+                # ref instead of paying a second network round-trip through pull()
+                try:
+                    self.__gitRepo.git.merge('--ff-only', f'origin/{branch}')
+                except GitCommandError as e:
+                    logger.error(f"Unable to update the {self.getName()} repository. {GitUtils.formatStderr(e.stderr)}")
+                    return False
             logger.success("Git successfully updated")
             return True
         return False
@@ -240,54 +441,75 @@ class GitUtils:
             logger.error("It's not possible to update any submodule in offline mode ...")
             return
         logger.verbose(f"Git {self.getName()} init submodules")
-        # These modules are init / updated manually
+        # These modules are init / updated manually (after an explicit user confirmation)
         blacklist_heavy_modules = ["exegol-resources"]
         # Submodules dont have depth submodule limits
         depth_limit = not self.__is_submodule
-        with console.status(f"Initialization of git submodules", spinner_style="blue") as s:
+        with _maybeStatus(f"Initialization of git submodules") as s:
             try:
-                submodules = self.__gitRepo.iter_submodules()
+                # Submodule update are skipped if blacklisted or if the depth limit is set
+                submodules = [subm for subm in self.__gitRepo.iter_submodules()
+                              if subm.name not in blacklist_heavy_modules and
+                              not (depth_limit and ('/' in subm.name or '\\' in subm.name))]
             except ValueError:
                 logger.error(f"Unable to find any git submodule from '{self.getName()}' repository. Check the path in the file {self.__repo_path / '.git'}")
                 return
+            if len(submodules) == 0:
+                return
+            # GitPython registers a freshly cloned submodule in the shared parent .git/config through
+            # a non-blocking lock file: first-time initialization must run serially to avoid racing on it
             for current_sub in submodules:
-                # Submodule update are skipped if blacklisted or if the depth limit is set
-                if current_sub.name in blacklist_heavy_modules or \
-                        (depth_limit and ('/' in current_sub.name or '\\' in current_sub.name)):
-                    continue
-                s.update(status=f"Downloading git submodules [green]{current_sub.name}[/green]")
-                from git.exc import GitCommandError
-                try:
-                    current_sub.update(recursive=True)
-                except GitCommandError as e:
-                    error = GitUtils.formatStderr(e.stderr)
-                    logger.debug(f"Unable tu update git submodule {current_sub.name}: {e}")
-                    if "unable to access" in error:
-                        logger.error("You don't have internet to update git submodule. Skipping operation.")
-                    else:
-                        logger.error("Unable to update git submodule. Skipping operation.")
-                        logger.error(error)
-                except ValueError:
-                    logger.error(f"Unable to update git submodule '{current_sub.name}'. Check the path in the file '{Path(current_sub.path) / '.git'}'")
+                if not current_sub.module_exists():
+                    s.update(status=f"Downloading git submodules [green]{current_sub.name}[/green]")
+                    self.__updateSubmodule(current_sub, init=True)
+            # Submodules have disjoint working trees: fetch and checkout concurrently to overlap
+            # network round-trips and pack decompression instead of paying each delay in sequence
+            with ThreadPoolExecutor(max_workers=min(8, len(submodules))) as executor:
+                futures = []
+                for current_sub in submodules:
+                    s.update(status=f"Downloading git submodules [green]{current_sub.name}[/green]")
+                    futures.append(executor.submit(self.__updateSubmodule, current_sub, recursive=True, init=True))
+                for future in as_completed(futures):
+                    future.result()
+
+    def __updateSubmodule(self, submodule: "Submodule", **kwargs) -> None:
+        """Update a single git submodule, logging failures instead of raising
+        (this also runs inside worker threads, where no exception may escape)."""
+        try:
+            submodule.update(**kwargs)
+        except GitCommandError as e:
+            error = GitUtils.formatStderr(e.stderr)
+            logger.debug(f"Unable tu update git submodule {submodule.name}: {e}")
+            if "unable to access" in error:
+                logger.error("You don't have internet to update git submodule. Skipping operation.")
+            else:
+                logger.error("Unable to update git submodule. Skipping operation.")
+                logger.error(error)
+        except ValueError:
+            logger.error(f"Unable to update git submodule '{submodule.name}'. Check the path in the file '{Path(submodule.path) / '.git'}'")
+        except Exception as e:
+            # e.g. an IOError on the parent config lock: log and move on instead of aborting the wrapper init
+            logger.error(f"Unable to update git submodule '{submodule.name}'. Skipping operation.")
+            logger.debug(e)
 
     def submoduleSourceUpdate(self, name: str) -> bool:
         """Update source code from the 'name' git submodule"""
         assert not ParametersManager().offline_mode
         if not self.isAvailable:
             return False
+        self.__fetch_cache = None
         assert self.__gitRepo is not None
         try:
             submodule = self.__gitRepo.submodule(name)
         except ValueError:
             logger.debug(f"Git submodule '{name}' not found.")
             return False
-        from git.exc import RepositoryDirtyError
         try:
-            from git.exc import GitCommandError
             try:
                 # TODO add TUI progress
-                with console.status(f"Downloading submodule [green]{name}[/green]", spinner_style="blue"):
-                    submodule.update(to_latest_revision=True)
+                with _maybeStatus(f"Downloading submodule [green]{name}[/green]"):
+                    submodule.update(to_latest_revision=True, recursive=True,
+                                     clone_multi_options=[f'--depth={self.SUBMODULE_CLONE_DEPTH}'])
             except GitCommandError as e:
                 logger.debug(f"Unable tu update git submodule {name}: {e}")
                 if "unable to access" in e.stderr:
@@ -307,13 +529,14 @@ class GitUtils:
     def checkout(self, branch: str) -> bool:
         """Change local git branch"""
         assert self.isAvailable
+        self.__fetch_cache = None
         if not self.safeCheck():
             return False
-        if branch == self.getCurrentBranch():
+        current_branch = self.getCurrentBranch()
+        if branch == current_branch:
             logger.warning(f"Branch '{branch}' is already the current branch")
             return False
         assert self.__gitRepo is not None
-        from git.exc import GitCommandError
         try:
             # If git local branch didn't exist, change HEAD to the origin branch and create a new local branch
             if branch not in self.__gitRepo.heads:
@@ -334,7 +557,6 @@ class GitUtils:
     def getTextStatus(self) -> str:
         """Get text status from git object for rich print."""
         if self.isAvailable:
-            from git.exc import GitCommandError
             try:
                 if self.isUpToDate():
                     result = "[green]Up to date[/green]"
@@ -369,6 +591,27 @@ class GitUtils:
     def formatStderr(cls, stderr):
         return stderr.replace('\n', '').replace('stderr:', '').strip().strip("'")
 
+    def close(self):
+        """Release the persistent git helper process (if any)."""
+        process = self.__catfile_process
+        self.__catfile_process = None
+        if process is not None:
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()
+                process.terminate()
+                # Reap the child to avoid leaving a zombie for the rest of the session
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+            except OSError:
+                pass
+
+    def __del__(self):
+        self.close()
+
     def __repr__(self) -> str:
         """Developer debug object representation"""
         return f"GitUtils '{self.__git_name}': {'Active' if self.isAvailable else 'Disable'}"